@@ -0,0 +1,95 @@
+"""Regenerate src/maya/_templates_data.py from the files in src/maya/templates.
+
+Run this after editing any template:
+
+    python scripts/generate_templates.py
+"""
+
+import os
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+PACKAGE_PATH = Path(__file__).resolve().parent.parent / "src" / "maya"
+TEMPLATE_PATH = PACKAGE_PATH / "templates"
+OUTPUT_PATH = PACKAGE_PATH / "_templates_data.py"
+MAX_LINE_LENGTH = 120
+
+HEADER = '''"""Contents of the files in templates/, embedded so that init never reads them from disk.
+
+Generated by scripts/generate_templates.py; do not edit by hand.
+"""
+
+from typing import Dict
+
+TEMPLATES: Dict[str, bytes] = {
+'''
+
+_ESCAPES = {ord("\\"): "\\\\", ord('"'): '\\"', ord("\n"): "\\n", ord("\r"): "\\r", ord("\t"): "\\t"}
+
+
+def iter_template_files(root: str) -> Iterator[Tuple[str, str]]:
+    """Yield every file below a directory without extra stat calls.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        Tuples of absolute path and relative POSIX path
+    """
+    prefix_len = len(root) + 1
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.path, entry.path[prefix_len:].replace(os.sep, "/")
+
+
+def bytes_literal(data: bytes) -> str:
+    """Format bytes as a double-quoted literal.
+
+    Args:
+        data: Bytes to format
+
+    Returns:
+        Python source for the literal
+    """
+    chars = (_ESCAPES.get(byte) or (chr(byte) if 0x20 <= byte < 0x7F else f"\\x{byte:02x}") for byte in data)
+    return 'b"' + "".join(chars) + '"'
+
+
+def render(templates: List[Tuple[str, bytes]]) -> str:
+    """Render the source of the templates data module.
+
+    Args:
+        templates: Relative path and content of each template
+
+    Returns:
+        Python source for the module
+    """
+    lines = [HEADER]
+    for rel_path, content in templates:
+        lines.append(f'    "{rel_path}": (\n')
+        for chunk in content.splitlines(keepends=True) or [b""]:
+            line = f"        {bytes_literal(chunk)}"
+            if len(line) > MAX_LINE_LENGTH:
+                line += "  # noqa: E501"
+            lines.append(line + "\n")
+        lines.append("    ),\n")
+    lines.append("}\n")
+    return "".join(lines)
+
+
+def main() -> None:
+    """Write the templates data module."""
+    templates = sorted(
+        (rel_path, Path(path).read_bytes()) for path, rel_path in iter_template_files(str(TEMPLATE_PATH))
+    )
+    OUTPUT_PATH.write_text(render(templates), encoding="utf-8")
+    print(f"Wrote {len(templates)} templates to {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,456 @@
+"""Contents of the files in templates/, embedded so that init never reads them from disk.
+
+Generated by scripts/generate_templates.py; do not edit by hand.
+"""
+
+from typing import Dict
+
+TEMPLATES: Dict[str, bytes] = {
+    ".github/workflows/python-ci.yml": (
+        b"name: Python CI\n"
+        b"\n"
+        b"on:\n"
+        b"  push:\n"
+        b"    branches: [ main, master ]\n"
+        b"  pull_request:\n"
+        b"    branches: [ main, master ]\n"
+        b"\n"
+        b"jobs:\n"
+        b"  test:\n"
+        b"    runs-on: ubuntu-latest\n"
+        b"    strategy:\n"
+        b"      matrix:\n"
+        b"        python-version: [\"3.8\", \"3.9\", \"3.10\", \"3.11\"]\n"
+        b"\n"
+        b"    steps:\n"
+        b"    - uses: actions/checkout@v3\n"
+        b"    \n"
+        b"    - name: Set up Python ${{ matrix.python-version }}\n"
+        b"      uses: actions/setup-python@v4\n"
+        b"      with:\n"
+        b"        python-version: ${{ matrix.python-version }}\n"
+        b"    \n"
+        b"    - name: Install dependencies\n"
+        b"      run: |\n"
+        b"        python -m pip install --upgrade pip\n"
+        b"        pip install just\n"
+        b"        just install\n"
+        b"    \n"
+        b"    - name: Lint with ruff\n"
+        b"      run: just lint\n"
+        b"    \n"
+        b"    - name: Test with pytest\n"
+        b"      run: just test\n"
+        b"\n"
+        b"  build:\n"
+        b"    needs: test\n"
+        b"    runs-on: ubuntu-latest\n"
+        b"    steps:\n"
+        b"    - uses: actions/checkout@v3\n"
+        b"    \n"
+        b"    - name: Set up Python\n"
+        b"      uses: actions/setup-python@v4\n"
+        b"      with:\n"
+        b"        python-version: \"3.10\"\n"
+        b"    \n"
+        b"    - name: Install dependencies\n"
+        b"      run: |\n"
+        b"        python -m pip install --upgrade pip\n"
+        b"        pip install build wheel just\n"
+        b"        just install\n"
+        b"    \n"
+        b"    - name: Build package\n"
+        b"      run: just build "
+    ),
+    ".gitignore": (
+        b"# Byte-compiled / optimized / DLL files\n"
+        b"__pycache__/\n"
+        b"*.py[cod]\n"
+        b"*$py.class\n"
+        b"\n"
+        b"# C extensions\n"
+        b"*.so\n"
+        b"\n"
+        b"# Distribution / packaging\n"
+        b".Python\n"
+        b"build/\n"
+        b"develop-eggs/\n"
+        b"dist/\n"
+        b"downloads/\n"
+        b"eggs/\n"
+        b".eggs/\n"
+        b"lib/\n"
+        b"lib64/\n"
+        b"parts/\n"
+        b"sdist/\n"
+        b"var/\n"
+        b"wheels/\n"
+        b"*.egg-info/\n"
+        b".installed.cfg\n"
+        b"*.egg\n"
+        b"MANIFEST\n"
+        b"\n"
+        b"# PyInstaller\n"
+        b"*.manifest\n"
+        b"*.spec\n"
+        b"\n"
+        b"# Installer logs\n"
+        b"pip-log.txt\n"
+        b"pip-delete-this-directory.txt\n"
+        b"\n"
+        b"# Unit test / coverage reports\n"
+        b"htmlcov/\n"
+        b".tox/\n"
+        b".nox/\n"
+        b".coverage\n"
+        b".coverage.*\n"
+        b".cache\n"
+        b"nosetests.xml\n"
+        b"coverage.xml\n"
+        b"*.cover\n"
+        b".hypothesis/\n"
+        b".pytest_cache/\n"
+        b"\n"
+        b"# Environments\n"
+        b".env\n"
+        b".venv\n"
+        b"env/\n"
+        b"venv/\n"
+        b"ENV/\n"
+        b"env.bak/\n"
+        b"venv.bak/\n"
+        b"\n"
+        b"# mypy, ruff, just\n"
+        b".mypy_cache/\n"
+        b".ruff_cache/\n"
+        b".dmypy.json\n"
+        b"dmypy.json\n"
+        b".just\n"
+        b"\n"
+        b"# IDE settings\n"
+        b".idea/\n"
+        b".vscode/\n"
+        b"*.swp\n"
+        b"*.swo "
+    ),
+    ".pre-commit-config.yaml": (
+        b"repos:\n"
+        b"  - repo: https://github.com/pre-commit/pre-commit-hooks\n"
+        b"    rev: v4.4.0\n"
+        b"    hooks:\n"
+        b"      - id: check-yaml\n"
+        b"      - id: check-json\n"
+        b"      - id: check-toml\n"
+        b"      - id: end-of-file-fixer\n"
+        b"      - id: trailing-whitespace\n"
+        b"      - id: check-added-large-files\n"
+        b"      - id: check-merge-conflict\n"
+        b"\n"
+        b"  - repo: https://github.com/psf/black\n"
+        b"    rev: 23.3.0\n"
+        b"    hooks:\n"
+        b"      - id: black\n"
+        b"\n"
+        b"  - repo: https://github.com/charliermarsh/ruff-pre-commit\n"
+        b"    rev: 'v0.0.272'\n"
+        b"    hooks:\n"
+        b"      - id: ruff\n"
+        b"        args: [--fix, --exit-non-zero-on-fix]\n"
+        b"\n"
+        b"  - repo: https://github.com/pre-commit/mirrors-mypy\n"
+        b"    rev: v1.3.0\n"
+        b"    hooks:\n"
+        b"      - id: mypy\n"
+        b"        additional_dependencies: []\n"
+        b"        exclude: ^tests/ "
+    ),
+    "README.md": (
+        b"# {{project_name}}\n"
+        b"\n"
+        b"[![Python CI](https://github.com/{{github_username}}/{{project_name}}/actions/workflows/python-ci.yml/badge.svg)](https://github.com/{{github_username}}/{{project_name}}/actions/workflows/python-ci.yml)\n"  # noqa: E501
+        b"\n"
+        b"A Python project with best practices for structure, linting, testing, and CI.\n"
+        b"\n"
+        b"## Features\n"
+        b"\n"
+        b"- \xf0\x9f\x93\xa6 Standardized project structure\n"
+        b"- \xf0\x9f\xa7\xb9 Linting and formatting with `ruff`, `mypy`, and `black`\n"
+        b"- \xf0\x9f\xa7\xaa Testing with `pytest` and coverage reporting\n"
+        b"- \xf0\x9f\x94\x84 Pre-commit hooks for code quality\n"
+        b"- \xf0\x9f\x9b\xa0\xef\xb8\x8f Task automation with `just` (improved alternative to `make`)\n"
+        b"- \xf0\x9f\x9a\x80 CI/CD with GitHub Actions\n"
+        b"\n"
+        b"## Project Structure\n"
+        b"\n"
+        b"```\n"
+        b"{{project_name}}/\n"
+        b"\xe2\x94\x9c\xe2\x94\x80\xe2\x94\x80 .github/\n"
+        b"\xe2\x94\x82   \xe2\x94\x94\xe2\x94\x80\xe2\x94\x80 workflows/\n"
+        b"\xe2\x94\x82       \xe2\x94\x94\xe2\x94\x80\xe2\x94\x80 python-ci.yml\n"
+        b"\xe2\x94\x9c\xe2\x94\x80\xe2\x94\x80 src/\n"
+        b"\xe2\x94\x82   \xe2\x94\x94\xe2\x94\x80\xe2\x94\x80 {{project_name}}/\n"
+        b"\xe2\x94\x82       \xe2\x94\x9c\xe2\x94\x80\xe2\x94\x80 __init__.py\n"
+        b"\xe2\x94\x82       \xe2\x94\x9c\xe2\x94\x80\xe2\x94\x80 __main__.py\n"
+        b"\xe2\x94\x82       \xe2\x94\x94\xe2\x94\x80\xe2\x94\x80 main.py\n"
+        b"\xe2\x94\x9c\xe2\x94\x80\xe2\x94\x80 tests/\n"
+        b"\xe2\x94\x82   \xe2\x94\x94\xe2\x94\x80\xe2\x94\x80 test_main.py\n"
+        b"\xe2\x94\x9c\xe2\x94\x80\xe2\x94\x80 .pre-commit-config.yaml\n"
+        b"\xe2\x94\x9c\xe2\x94\x80\xe2\x94\x80 justfile\n"
+        b"\xe2\x94\x9c\xe2\x94\x80\xe2\x94\x80 pyproject.toml\n"
+        b"\xe2\x94\x94\xe2\x94\x80\xe2\x94\x80 README.md\n"
+        b"```\n"
+        b"\n"
+        b"## Getting Started\n"
+        b"\n"
+        b"### Prerequisites\n"
+        b"\n"
+        b"- Python {{python_version}} or higher\n"
+        b"- [just](https://github.com/casey/just) command runner\n"
+        b"- [pipx](https://github.com/pypa/pipx) (recommended for installing CLI tools)\n"
+        b"\n"
+        b"Install the `just` command runner:\n"
+        b"\n"
+        b"```bash\n"
+        b"# On macOS\n"
+        b"brew install just\n"
+        b"\n"
+        b"# On Linux\n"
+        b"pipx install just\n"
+        b"\n"
+        b"# On Windows (with chocolatey)\n"
+        b"choco install just\n"
+        b"```\n"
+        b"\n"
+        b"### Setup\n"
+        b"\n"
+        b"Run the setup command:\n"
+        b"\n"
+        b"```bash\n"
+        b"just setup-dev\n"
+        b"```\n"
+        b"\n"
+        b"This will:\n"
+        b"- Install the package in development mode\n"
+        b"- Install all development dependencies\n"
+        b"- Setup pre-commit hooks\n"
+        b"\n"
+        b"## Development Tasks\n"
+        b"\n"
+        b"The `justfile` provides various commands for common development tasks:\n"
+        b"\n"
+        b"```bash\n"
+        b"# Show all available commands\n"
+        b"just\n"
+        b"\n"
+        b"# Install the package and dependencies\n"
+        b"just install\n"
+        b"\n"
+        b"# Format code\n"
+        b"just format\n"
+        b"\n"
+        b"# Lint code\n"
+        b"just lint\n"
+        b"\n"
+        b"# Run tests with coverage\n"
+        b"just test\n"
+        b"\n"
+        b"# Run the application\n"
+        b"just run\n"
+        b"\n"
+        b"# Clean build artifacts\n"
+        b"just clean\n"
+        b"\n"
+        b"# Run pre-commit hooks on all files\n"
+        b"just pre-commit-all\n"
+        b"```\n"
+        b"\n"
+        b"## License\n"
+        b"\n"
+        b"This project is licensed under the MIT License - see the LICENSE file for details. "
+    ),
+    "justfile": (
+        b"# List all available commands\n"
+        b"default:\n"
+        b"    @just --list\n"
+        b"\n"
+        b"# Install the package and development dependencies\n"
+        b"install:\n"
+        b"    pip install -e \".[dev]\"\n"
+        b"    pre-commit install\n"
+        b"\n"
+        b"# Format code\n"
+        b"format:\n"
+        b"    black src tests\n"
+        b"    ruff check --fix src tests\n"
+        b"\n"
+        b"# Lint code\n"
+        b"lint:\n"
+        b"    ruff check src tests\n"
+        b"    mypy src tests\n"
+        b"\n"
+        b"# Run tests with coverage\n"
+        b"test:\n"
+        b"    pytest --cov={{project_name}} --cov-report=term-missing\n"
+        b"\n"
+        b"# Clean artifacts\n"
+        b"clean:\n"
+        b"    rm -rf build/\n"
+        b"    rm -rf dist/\n"
+        b"    rm -rf *.egg-info\n"
+        b"    rm -rf .pytest_cache/\n"
+        b"    rm -rf .coverage\n"
+        b"    rm -rf htmlcov/\n"
+        b"    rm -rf .mypy_cache/\n"
+        b"    rm -rf .ruff_cache/\n"
+        b"    find . -type d -name __pycache__ -exec rm -rf {} +\n"
+        b"\n"
+        b"# Build package\n"
+        b"build: clean\n"
+        b"    python -m build\n"
+        b"\n"
+        b"# Run pre-commit hooks on all files\n"
+        b"pre-commit-all:\n"
+        b"    pre-commit run --all-files\n"
+        b"\n"
+        b"# Setup a new development environment\n"
+        b"setup-dev: install\n"
+        b"    @echo \"Development environment set up successfully!\"\n"
+        b"\n"
+        b"# Run the main application\n"
+        b"run:\n"
+        b"    python -m {{project_name}} "
+    ),
+    "justfile-uv": (
+        b"# List all available commands\n"
+        b"default:\n"
+        b"    @just --list\n"
+        b"\n"
+        b"# Install the package and development dependencies\n"
+        b"install:\n"
+        b"    uv pip install -e \".[dev]\"\n"
+        b"    pre-commit install\n"
+        b"\n"
+        b"# Format code\n"
+        b"format:\n"
+        b"    black src tests\n"
+        b"    ruff check --fix src tests\n"
+        b"\n"
+        b"# Lint code\n"
+        b"lint:\n"
+        b"    ruff check src tests\n"
+        b"    mypy src tests\n"
+        b"\n"
+        b"# Run tests with coverage\n"
+        b"test:\n"
+        b"    pytest --cov={{project_name}} --cov-report=term-missing\n"
+        b"\n"
+        b"# Clean artifacts\n"
+        b"clean:\n"
+        b"    rm -rf build/\n"
+        b"    rm -rf dist/\n"
+        b"    rm -rf *.egg-info\n"
+        b"    rm -rf .pytest_cache/\n"
+        b"    rm -rf .coverage\n"
+        b"    rm -rf htmlcov/\n"
+        b"    rm -rf .mypy_cache/\n"
+        b"    rm -rf .ruff_cache/\n"
+        b"    find . -type d -name __pycache__ -exec rm -rf {} +\n"
+        b"\n"
+        b"# Build package\n"
+        b"build: clean\n"
+        b"    python -m build\n"
+        b"\n"
+        b"# Run pre-commit hooks on all files\n"
+        b"pre-commit-all:\n"
+        b"    pre-commit run --all-files\n"
+        b"\n"
+        b"# Setup a new development environment\n"
+        b"setup-dev: install\n"
+        b"    @echo \"Development environment set up successfully!\"\n"
+        b"\n"
+        b"# Run the main application\n"
+        b"run:\n"
+        b"    python -m {{project_name}}\n"
+        b"\n"
+        b"# Install a new dependency with uv\n"
+        b"add-dep package:\n"
+        b"    uv pip install {{package}}\n"
+        b"    uv pip freeze > requirements.txt "
+    ),
+    "pyproject.toml": (
+        b"[build-system]\n"
+        b"requires = [\"setuptools>=61.0.0\", \"wheel\"]\n"
+        b"build-backend = \"setuptools.build_meta\"\n"
+        b"\n"
+        b"[project]\n"
+        b"name = \"{{project_name}}\"\n"
+        b"version = \"0.1.0\"\n"
+        b"description = \"Project description\"\n"
+        b"authors = [\n"
+        b"    {name = \"{{author_name}}\", email = \"{{author_email}}\"}\n"
+        b"]\n"
+        b"readme = \"README.md\"\n"
+        b"requires-python = \">={{python_version}}\"\n"
+        b"license = {text = \"MIT\"}\n"
+        b"classifiers = [\n"
+        b"    \"Programming Language :: Python :: 3\",\n"
+        b"    \"License :: OSI Approved :: MIT License\",\n"
+        b"    \"Operating System :: OS Independent\",\n"
+        b"]\n"
+        b"dependencies = []\n"
+        b"\n"
+        b"[project.urls]\n"
+        b"\"Homepage\" = \"https://github.com/{{github_username}}/{{project_name}}\"\n"
+        b"\"Bug Tracker\" = \"https://github.com/{{github_username}}/{{project_name}}/issues\"\n"
+        b"\n"
+        b"[project.optional-dependencies]\n"
+        b"dev = [\n"
+        b"    \"pytest>=7.3.1\",\n"
+        b"    \"pytest-cov>=4.1.0\",\n"
+        b"    \"black>=23.3.0\",\n"
+        b"    \"mypy>=1.3.0\",\n"
+        b"    \"ruff>=0.0.272\",\n"
+        b"]\n"
+        b"\n"
+        b"[tool.setuptools]\n"
+        b"package-dir = {\"\" = \"src\"}\n"
+        b"\n"
+        b"[tool.setuptools.packages.find]\n"
+        b"where = [\"src\"]\n"
+        b"\n"
+        b"[tool.mypy]\n"
+        b"python_version = \"{{python_version}}\"\n"
+        b"warn_return_any = true\n"
+        b"warn_unused_configs = true\n"
+        b"disallow_untyped_defs = true\n"
+        b"disallow_incomplete_defs = true\n"
+        b"check_untyped_defs = true\n"
+        b"disallow_untyped_decorators = true\n"
+        b"no_implicit_optional = true\n"
+        b"strict_optional = true\n"
+        b"\n"
+        b"[[tool.mypy.overrides]]\n"
+        b"module = \"tests.*\"\n"
+        b"disallow_untyped_defs = false\n"
+        b"disallow_incomplete_defs = false\n"
+        b"\n"
+        b"[tool.ruff]\n"
+        b"select = [\"E\", \"F\", \"B\", \"I\"]\n"
+        b"ignore = []\n"
+        b"line-length = 88\n"
+        b"target-version = \"py38\"\n"
+        b"fix = true\n"
+        b"\n"
+        b"[tool.ruff.isort]\n"
+        b"known-first-party = [\"{{project_name}}\"]\n"
+        b"\n"
+        b"[tool.pytest.ini_options]\n"
+        b"testpaths = [\"tests\"]\n"
+        b"python_files = \"test_*.py\"\n"
+        b"addopts = \"--cov={{project_name}}\"\n"
+        b"\n"
+        b"[tool.coverage.run]\n"
+        b"source = [\"{{project_name}}\"]\n"
+        b"omit = [\"tests/*\"] "
+    ),
+}
@@ -4,21 +4,58 @@ import os
 import re
 import shutil
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Set, Tuple
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
+
+from maya import __version__
+from maya._templates_data import TEMPLATES
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 app = typer.Typer(
     help="Initialize Python projects with best practices for linting, testing, and CI."
 )
-console = Console()
+
+
+@lru_cache(maxsize=None)
+def _console() -> "Console":
+    """Return the shared console, importing rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
 
 # Use str instead of Literal for package manager
 # PackageManager = Literal["pip", "uv"]
 
+_PROJECT_NAME_RE = re.compile(r"[A-Za-z][A-Za-z0-9_]*\Z")
+_PLACEHOLDER_RE = re.compile(rb"\{\{(project_name|author_name|author_email|github_username|python_version)\}\}")
+_JUSTFILE_TEMPLATES = ("justfile", "justfile-uv")
+
+# Generated Python files as (relative path, content) pairs, formatted with {name} and {title}
+_STUBS: Tuple[Tuple[str, str], ...] = (
+    (
+        "src/{name}/__init__.py",
+        '"""\n{title} - Your project description here.\n"""\n\n__version__ = "0.1.0"\n',
+    ),
+    (
+        "src/{name}/__main__.py",
+        '"""Main entry point for the package when run as a module."""\n\nfrom {name}.main import main\n\nif __name__ == "__main__":\n    main()\n',  # noqa: E501
+    ),
+    (
+        "src/{name}/main.py",
+        '"""Main module for the {title} application."""\n\nfrom typing import List, Optional\n\n\ndef main() -> None:\n    """Main entry point for the application."""\n    print("Hello from {name}!")\n\n\nif __name__ == "__main__":\n    main()\n',  # noqa: E501
+    ),
+    (
+        "tests/test_main.py",
+        '"""Tests for the main module."""\n\nimport pytest\n\nfrom {name}.main import main\n\n\ndef test_main() -> None:\n    """Test the main function."""\n    # This is a placeholder test\n    assert True\n',  # noqa: E501
+    ),
+)
+
 
 def create_directory_structure(project_path: Path) -> None:
     """Create the directory structure for a new project.
@@ -26,22 +63,26 @@ def create_directory_structure(project_path: Path) -> None:
     Args:
         project_path: The path to the new project
     """
+    package_path = project_path / "src" / project_path.name
     dirs = [
-        project_path / "src" / project_path.name,
+        package_path,
         project_path / "tests",
         project_path / "docs",
         project_path / ".github" / "workflows",
     ]
 
-    for dir_path in dirs:
-        dir_path.mkdir(parents=True, exist_ok=True)
-        (dir_path / "__init__.py").touch(exist_ok=True)
+    # Shortest paths first, so shared ancestors exist before deeper leaves are created
+    for dir_path in sorted({str(dir_path) for dir_path in dirs}, key=len):
+        os.makedirs(dir_path, exist_ok=True)
+
+    # Only the source package needs an __init__.py
+    (package_path / "__init__.py").touch(exist_ok=True)
 
-    # Remove __init__.py from root directories where it's not needed
-    if (project_path / "__init__.py").exists():
-        os.remove(project_path / "__init__.py")
-    if (project_path / "tests" / "__init__.py").exists():
-        os.remove(project_path / "tests" / "__init__.py")
+
+@lru_cache(maxsize=None)
+def _name_pattern(name: str) -> "re.Pattern[str]":
+    """Return a compiled case-insensitive pattern matching a project name."""
+    return re.compile(re.escape(name), re.IGNORECASE)
 
 
 def replace_project_name(file_path: Path, old_name: str, new_name: str) -> None:
@@ -52,15 +93,13 @@ def replace_project_name(file_path: Path, old_name: str, new_name: str) -> None:
         old_name: Original project name
         new_name: New project name
     """
-    with open(file_path, "r", encoding="utf-8") as file:
-        content = file.read()
+    content = file_path.read_text(encoding="utf-8")
 
     # Replace the project name, being careful with case (maya, MAYA, Maya)
-    pattern = re.compile(re.escape(old_name), re.IGNORECASE)
-    content = pattern.sub(lambda m: new_name if m.group(0).islower() else new_name.title(), content)
+    titled_name = new_name.title()
+    content = _name_pattern(old_name).sub(lambda m: new_name if m.group(0).islower() else titled_name, content)
 
-    with open(file_path, "w", encoding="utf-8") as file:
-        file.write(content)
+    file_path.write_text(content, encoding="utf-8")
 
 
 def copy_template_files(
@@ -81,67 +120,45 @@ def copy_template_files(
         author_email: Author's email
         github_username: GitHub username
     """
-    template_path = Path(__file__).parent / "templates"
-    
-    # Copy template files
-    for template_file in template_path.glob("**/*"):
-        # Skip justfile templates, we'll handle those separately
-        if template_file.name in ["justfile-uv", "justfile"] or not template_file.is_file():
-            continue
-        
-        rel_path = template_file.relative_to(template_path)
-        dest_path = project_path / rel_path
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Read the template file
-        with open(template_file, "r", encoding="utf-8") as file:
-            content = file.read()
-        
-        # Replace placeholders with actual values
-        replacements = {
-            "{{project_name}}": project_path.name,
-            "{{author_name}}": author_name,
-            "{{author_email}}": author_email,
-            "{{github_username}}": github_username,
-            "{{python_version}}": python_version,
-        }
-        
-        for placeholder, value in replacements.items():
-            content = content.replace(placeholder, value)
-        
-        # Write the customized file
-        with open(dest_path, "w", encoding="utf-8") as file:
-            file.write(content)
+    name = project_path.name
+    title = name.title()
 
-    # Handle justfile based on package manager
-    if package_manager == "uv":
-        just_template = template_path / "justfile-uv"
-    else:
-        just_template = template_path / "justfile"
-    
-    with open(just_template, "r", encoding="utf-8") as file:
-        content = file.read()
-    
-    # Replace placeholders
-    for placeholder, value in replacements.items():
-        content = content.replace(placeholder, value)
-    
-    with open(project_path / "justfile", "w", encoding="utf-8") as file:
-        file.write(content)
+    # Placeholder values shared by every template, encoded since templates are bytes
+    replacements = {
+        b"project_name": name.encode("utf-8"),
+        b"author_name": author_name.encode("utf-8"),
+        b"author_email": author_email.encode("utf-8"),
+        b"github_username": github_username.encode("utf-8"),
+        b"python_version": python_version.encode("utf-8"),
+    }
+
+    # Only the justfile template for the chosen package manager is copied, as "justfile"
+    justfile_template = "justfile-uv" if package_manager == "uv" else "justfile"
 
-    # Create main module files
-    with open(project_path / "src" / project_path.name / "__init__.py", "w", encoding="utf-8") as f:
-        f.write(f'"""\n{project_path.name.title()} - Your project description here.\n"""\n\n__version__ = "0.1.0"\n')
+    # Render template files, creating their directories up front
+    writes: Dict[Path, bytes] = {}
+    created_dirs: Set[Path] = set()
+    for rel_path, template in TEMPLATES.items():
+        if rel_path in _JUSTFILE_TEMPLATES:
+            if rel_path != justfile_template:
+                continue
+            rel_path = "justfile"
 
-    with open(project_path / "src" / project_path.name / "__main__.py", "w", encoding="utf-8") as f:
-        f.write(f'"""Main entry point for the package when run as a module."""\n\nfrom {project_path.name}.main import main\n\nif __name__ == "__main__":\n    main()\n')  # noqa: E501
+        dest_path = project_path / rel_path
+        if dest_path.parent not in created_dirs:
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(dest_path.parent)
+        
+        # Replace placeholders with actual values
+        writes[dest_path] = _PLACEHOLDER_RE.sub(lambda m: replacements[m.group(1)], template)
 
-    with open(project_path / "src" / project_path.name / "main.py", "w", encoding="utf-8") as f:
-        f.write(f'"""Main module for the {project_path.name.title()} application."""\n\nfrom typing import List, Optional\n\n\ndef main() -> None:\n    """Main entry point for the application."""\n    print("Hello from {project_path.name}!")\n\n\nif __name__ == "__main__":\n    main()\n')  # noqa: E501
+    # Render main module files and a test file
+    stub_fields = {"name": name, "title": title}
+    for rel_path, stub in _STUBS:
+        writes[project_path / rel_path.format_map(stub_fields)] = stub.format_map(stub_fields).encode("utf-8")
 
-    # Create a test file
-    with open(project_path / "tests" / "test_main.py", "w", encoding="utf-8") as f:
-        f.write(f'"""Tests for the main module."""\n\nimport pytest\n\nfrom {project_path.name}.main import main\n\n\ndef test_main() -> None:\n    """Test the main function."""\n    # This is a placeholder test\n    assert True\n')  # noqa: E501
+    for dest_path, content in writes.items():
+        dest_path.write_bytes(content)
 
 
 @app.command()
@@ -168,14 +185,17 @@ def init(
     Creates a new project directory with a standardized structure,
     linting, testing, and CI configuration.
     """
+    from rich.panel import Panel
+    from rich.text import Text
+
     # Validate package manager input
     if package_manager not in ["pip", "uv"]:
-        console.print(f"[bold red]Error:[/] Package manager must be either 'pip' or 'uv', got '{package_manager}'.")
+        _console().print(f"[bold red]Error:[/] Package manager must be either 'pip' or 'uv', got '{package_manager}'.")
         sys.exit(1)
 
     # Validate project name (should be a valid Python package name)
-    if not re.match(r"^[a-zA-Z][a-zA-Z0-9_]*$", project_name):
-        console.print(f"[bold red]Error:[/] Project name '{project_name}' is not a valid Python package name.")
+    if not _PROJECT_NAME_RE.match(project_name):
+        _console().print(f"[bold red]Error:[/] Project name '{project_name}' is not a valid Python package name.")
         sys.exit(1)
     
     # Set defaults for optional parameters
@@ -195,11 +215,17 @@ def init(
             default=False,
         )
         if not overwrite:
-            console.print("[yellow]Aborted.[/]")
+            _console().print("[yellow]Aborted.[/]")
             sys.exit(0)
-        shutil.rmtree(project_path)
+        # An empty directory only needs a single rmdir
+        with os.scandir(project_path) as entries:
+            is_empty = next(entries, None) is None
+        if is_empty:
+            project_path.rmdir()
+        else:
+            shutil.rmtree(project_path)
     
-    console.print(f"[green]Creating project: [bold]{project_name}[/][/]")
+    _console().print(f"[green]Creating project: [bold]{project_name}[/][/]")
     
     # Create directory structure
     create_directory_structure(project_path)
@@ -215,7 +241,7 @@ def init(
     )
     
     # Display summary
-    console.print(
+    _console().print(
         Panel(
             Text.from_markup(
                 f"[bold green]Project created successfully![/]\n\n"
@@ -230,7 +256,7 @@ def init(
     
     # Show additional information about uv if selected
     if package_manager == "uv":
-        console.print(
+        _console().print(
             Panel(
                 Text.from_markup(
                     "[bold blue]UV Package Manager[/]\n\n"
@@ -249,11 +275,7 @@ def init(
 @app.command()
 def version() -> None:
     """Show the version of the Maya CLI tool."""
-    try:
-        from maya import __version__
-        console.print(f"Maya CLI v{__version__}")
-    except ImportError:
-        console.print("Maya CLI v0.1.0")
+    typer.echo(f"Maya CLI v{__version__}")
 
 
 def main() -> None:
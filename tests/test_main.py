@@ -1,13 +1,19 @@
 """Tests for the main module."""
 
 import os
+import re
+import subprocess
+import sys
 from pathlib import Path
-from typing import Generator
+from typing import Generator, Optional
 
 import pytest
 from typer.testing import CliRunner
 
-from maya.main import app
+import maya
+from maya import __version__
+from maya._templates_data import TEMPLATES
+from maya.main import app, replace_project_name
 
 
 @pytest.fixture
@@ -27,7 +33,21 @@ def temp_project_dir(tmp_path: Path) -> Generator[Path, None, None]:
 def test_init_command(runner: CliRunner, temp_project_dir: Path) -> None:
     """Test the init command creates a project structure."""
     project_name = "test_project"
-    result = runner.invoke(app, ["init", project_name])
+    result = runner.invoke(
+        app,
+        [
+            "init",
+            project_name,
+            "-a",
+            "Jöhn Doe",
+            "-e",
+            "john@example.com",
+            "-g",
+            "johndoe",
+            "-py",
+            "3.10",
+        ],
+    )
     assert result.exit_code == 0
     assert "Project created successfully" in result.stdout
     
@@ -39,12 +59,39 @@ def test_init_command(runner: CliRunner, temp_project_dir: Path) -> None:
     assert (project_dir / "src").exists()
     assert (project_dir / "tests").exists()
     assert (project_dir / ".github").exists()
+    assert (project_dir / "src" / project_name / "__init__.py").exists()
+    assert not (project_dir / "tests" / "__init__.py").exists()
+    assert not (project_dir / "docs" / "__init__.py").exists()
+    assert not (project_dir / ".github" / "workflows" / "__init__.py").exists()
     
     # Check main files
     assert (project_dir / "pyproject.toml").exists()
     assert (project_dir / "justfile").exists()
     assert (project_dir / ".pre-commit-config.yaml").exists()
 
+    # Check the generated package modules
+    package_dir = project_dir / "src" / project_name
+    assert "Test_Project - Your project description here." in (package_dir / "__init__.py").read_text(encoding="utf-8")
+    assert f"from {project_name}.main import main" in (package_dir / "__main__.py").read_text(encoding="utf-8")
+
+    # Check the pip justfile was used
+    justfile = (project_dir / "justfile").read_text(encoding="utf-8")
+    assert "pip install -e" in justfile
+    assert "uv pip" not in justfile
+    assert not (project_dir / "justfile-uv").exists()
+
+    # Check placeholders were filled in
+    pyproject = (project_dir / "pyproject.toml").read_text(encoding="utf-8")
+    assert '{name = "Jöhn Doe", email = "john@example.com"}' in pyproject
+    assert 'requires-python = ">=3.10"' in pyproject
+    readme = (project_dir / "README.md").read_text(encoding="utf-8")
+    assert f"# {project_name}" in readme
+    assert f"https://github.com/johndoe/{project_name}" in readme
+    placeholder = re.compile(r"\{\{(project_name|author_name|author_email|github_username|python_version)\}\}")
+    for path in project_dir.rglob("*"):
+        if path.is_file():
+            assert not placeholder.search(path.read_text(encoding="utf-8")), path
+
 
 def test_init_with_uv(runner: CliRunner, temp_project_dir: Path) -> None:
     """Test the init command with uv package manager."""
@@ -62,10 +109,73 @@ def test_init_with_uv(runner: CliRunner, temp_project_dir: Path) -> None:
     with open(justfile_path, "r") as f:
         content = f.read()
         assert "uv pip install" in content
+    assert not (temp_project_dir / project_name / "justfile-uv").exists()
+
+
+@pytest.mark.parametrize("existing_file", [None, "old.txt"])
+def test_init_overwrites_existing_directory(
+    runner: CliRunner, temp_project_dir: Path, existing_file: Optional[str]
+) -> None:
+    """Test the init command replaces an existing directory when confirmed."""
+    project_name = "existing_project"
+    project_dir = temp_project_dir / project_name
+    project_dir.mkdir()
+    if existing_file:
+        (project_dir / existing_file).touch()
+
+    result = runner.invoke(app, ["init", project_name], input="y\n")
+    assert result.exit_code == 0
+    assert (project_dir / "pyproject.toml").exists()
+    assert not (project_dir / "old.txt").exists()
+
+
+@pytest.mark.parametrize("project_name", ["1project", "my-project", "project\n"])
+def test_init_rejects_invalid_name(runner: CliRunner, temp_project_dir: Path, project_name: str) -> None:
+    """Test the init command rejects names that are not valid package names."""
+    result = runner.invoke(app, ["init", project_name])
+    assert result.exit_code == 1
+    assert "not a valid Python package name" in result.stdout
+    assert not (temp_project_dir / project_name).exists()
+
+
+def test_replace_project_name(tmp_path: Path) -> None:
+    """Test the project name is replaced keeping lowercase or title case."""
+    file_path = tmp_path / "names.txt"
+    file_path.write_text("maya Maya MAYA", encoding="utf-8")
+    replace_project_name(file_path, "maya", "foo")
+    assert file_path.read_text(encoding="utf-8") == "foo Foo Foo"
 
 
 def test_version_command(runner: CliRunner) -> None:
     """Test the version command."""
     result = runner.invoke(app, ["version"])
     assert result.exit_code == 0
-    assert "Maya CLI" in result.stdout 
\ No newline at end of file
+    assert f"Maya CLI v{__version__}" in result.stdout 
+
+
+def test_version_command_does_not_import_rich() -> None:
+    """Test the version command runs without loading rich."""
+    code = (
+        "import sys\n"
+        "from maya.main import main\n"
+        "sys.argv = ['maya', 'version']\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "assert not any(m == 'rich' or m.startswith('rich.') for m in sys.modules), 'rich was imported'\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert f"Maya CLI v{__version__}" in result.stdout
+
+
+def test_embedded_templates_match_template_files() -> None:
+    """Test the embedded templates are in sync with the templates directory."""
+    template_path = Path(maya.__file__).parent / "templates"
+    template_files = {
+        path.relative_to(template_path).as_posix(): path.read_bytes()
+        for path in template_path.rglob("*")
+        if path.is_file()
+    }
+    assert TEMPLATES == template_files, "Run scripts/generate_templates.py to update src/maya/_templates_data.py"